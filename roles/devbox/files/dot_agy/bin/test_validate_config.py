@@ -11,12 +11,13 @@ warnings), including the boundary cases that must NOT be flagged.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import validate_config as vc
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    import pytest
 
 
 def _codes(messages: list[str]) -> list[str]:
@@ -181,6 +182,46 @@ def test_hidden_dir_not_scanned(tmp_path: Path) -> None:
     assert _codes(warnings).count("CMD_BARE") == 0
 
 
+# --- parse_frontmatter ---------------------------------------------------------
+
+
+def test_parse_frontmatter_simple_and_quoted() -> None:
+    content = '---\nname: x\ndescription: "has: colons"\nskills: a, b\n---\nbody: no\n'
+    assert vc.parse_frontmatter(content) == {
+        "name": "x",
+        "description": "has: colons",
+        "skills": "a, b",
+    }
+
+
+def test_parse_frontmatter_quote_edge_cases() -> None:
+    content = '---\na: \'single\'\nb: "mixed\'\nc: ""\nd: "x" tail\n---\n'
+    assert vc.parse_frontmatter(content) == {
+        "a": "single",
+        "b": "\"mixed'",
+        "c": "",
+        "d": '"x" tail',
+    }
+
+
+def test_parse_frontmatter_folded_block() -> None:
+    content = "---\ndescription: >\n  first line\n  second line\nmodel: opus\n---\n"
+    assert vc.parse_frontmatter(content) == {
+        "description": "first line second line",
+        "model": "opus",
+    }
+
+
+def test_parse_frontmatter_skips_list_items() -> None:
+    content = "---\ntriggers:\n  - lint: strict\nname: x\n---\n"
+    assert vc.parse_frontmatter(content) == {"triggers": "", "name": "x"}
+
+
+def test_parse_frontmatter_missing_or_unclosed() -> None:
+    assert vc.parse_frontmatter("# Title\n\nname: x\n") is None
+    assert vc.parse_frontmatter("---\nname: x\nbody\n") is None
+
+
 # --- parse_yaml_list: inline + block YAML lists -------------------------------
 
 
@@ -199,6 +240,11 @@ def test_parse_yaml_list_absent() -> None:
     assert vc.parse_yaml_list(content, "related") == []
 
 
+def test_parse_yaml_list_without_frontmatter() -> None:
+    content = "# Title\n\nrelated: [alpha]\n"
+    assert vc.parse_yaml_list(content, "related") == []
+
+
 def test_parse_yaml_list_block() -> None:
     content = "---\ntriggers:\n  - lint\n  - noqa\n  - eslint-disable\n---\nbody\n"
     assert vc.parse_yaml_list(content, "triggers") == ["lint", "noqa", "eslint-disable"]
@@ -463,3 +509,271 @@ def test_fpf_refs_unparsable_spec_errors(tmp_path: Path) -> None:
     errors, _ = vc.check_fpf_spec_refs(root)
     assert _codes(errors) == ["FPF_REFS"]
     assert "format changed" in errors[0]
+
+
+# --- run_checks: shared directory listing cache -------------------------------
+
+
+def test_run_checks_counts_from_dir_cache(tmp_path: Path) -> None:
+    root = _build_related_root(tmp_path)
+    (root / "skills" / "no_skill_md").mkdir()
+    (root / "agents" / "notes.txt").write_text("not an agent\n")
+    _build_root(root, ["plan"], {})
+    results = vc.run_checks(root, ["agents", "skills", "commands"])
+    assert results["counts"]["agents"] == 1
+    assert results["counts"]["skills"] == 2
+    assert results["counts"]["commands"] == 1
+    assert "SKILL_FILE" in _codes(results["errors"])
+
+
+def test_check_agents_uses_supplied_cache(tmp_path: Path) -> None:
+    root = _build_related_root(tmp_path)
+    cache = vc._scan_dirs(root)
+    cache.available_skills.discard("alpha")
+    errors, _ = vc.check_agents(root, cache)
+    assert _codes(errors) == ["SKILL_REF"]
+
+
+def test_symlinked_skill_dir_counts_as_skill(tmp_path: Path) -> None:
+    root = _build_related_root(tmp_path / "root")
+    external = tmp_path / "external" / "gamma"
+    external.mkdir(parents=True)
+    (external / "SKILL.md").write_text("---\nname: gamma\ndescription: g\n---\nbody\n")
+    (root / "skills" / "gamma").symlink_to(external, target_is_directory=True)
+    assert vc._scan_dirs(root).available_skills == {"alpha", "beta", "gamma"}
+
+
+def test_agent_files_read_once_across_checks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _build_related_root(tmp_path)
+    reads: list[str] = []
+    original = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    vc.run_checks(root, ["agents", "references", "stale"])
+    assert reads.count("agent_one.md") == 1
+
+
+def _build_meta_root(tmp_path: Path, skills: str) -> Path:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "meta_reviewer.md").write_text(
+        f"---\nname: meta_reviewer\ndescription: m\nmodel: opus\nskills: {skills}\n---\nbody\n"
+    )
+    for name in ("agent-builder", "skill-builder"):
+        (tmp_path / "skills" / name).mkdir(parents=True)
+        (tmp_path / "skills" / name / "SKILL.md").write_text(f"---\nname: {name}\n---\n")
+    return tmp_path
+
+
+def test_meta_pipeline_reuses_agent_frontmatter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _build_meta_root(tmp_path, "[agent-builder]")
+    cache = vc._scan_dirs(root)
+    cache.load_agent_docs()
+    reads: list[Path] = []
+    monkeypatch.setattr(Path, "read_text", reads.append)
+    errors, _ = vc.check_meta_pipeline(root, cache)
+    assert reads == []
+    assert errors == ['[META_PIPELINE] meta_reviewer.md: "skill-builder" missing from skills']
+
+
+def test_meta_pipeline_reads_file_without_agent_docs(tmp_path: Path) -> None:
+    root = _build_meta_root(tmp_path, "agent-builder, skill-builder")
+    cache = vc._scan_dirs(root)
+    assert vc.check_meta_pipeline(root, cache) == ([], [])
+    assert cache.agent_docs is None
+    (root / "agents" / "meta_reviewer.md").unlink()
+    errors, _ = vc.check_meta_pipeline(root, vc._scan_dirs(root))
+    assert errors == ["[META_PIPELINE] agents/meta_reviewer.md not found"]
+
+
+def test_cr_only_agent_file_parses_like_read_text(tmp_path: Path) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "a.md").write_bytes(
+        b"---\rname: a\rdescription: d\rmodel: opus\r---\rbody\rsee go/go_x\r"
+    )
+    cache = vc._scan_dirs(tmp_path)
+    [(_, _, fm)] = cache.load_agent_docs()
+    assert fm == {"name": "a", "description": "d", "model": "opus"}
+    _, warnings = vc.check_stale_patterns(tmp_path, cache)
+    assert warnings == ["[STALE] a.md:7: old-style Go doc reference"]
+
+
+# --- check_stale_patterns: old-style doc refs outside code fences -------------
+
+
+def test_stale_patterns_skip_fences_and_dedupe_per_line(tmp_path: Path) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "a.md").write_text(
+        "go/go_x and go/go_y\n"
+        "```\n"
+        "python/python_inside\n"
+        "```\n"
+        "python/python_z go/go_w\n"
+        "  ```text\n"
+        "go/go_unterminated\n"
+    )
+    _, warnings = vc.check_stale_patterns(tmp_path)
+    assert warnings == [
+        "[STALE] a.md:1: old-style Go doc reference",
+        "[STALE] a.md:5: old-style Go doc reference",
+        "[STALE] a.md:5: old-style Python doc reference",
+    ]
+
+
+# --- check_references: broken relative links in agents ------------------------
+
+
+def test_references_resolve_with_fragment_and_skip_urls(tmp_path: Path) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n")
+    (tmp_path / "agents" / "a.md").write_text(
+        '[g](guide.md#setup) [d](docs/guide.md) [t](guide.md "Title")\n'
+        "[u](https://x.y/z) [f](file:///etc/x) [v](vscode://open) [m](mailto:a@b)\n"
+        "[anchor](#top) [up](../outside.md)\n"
+        "[a](<https://example.com/x>) [c](foo.md?u=http://x)\n"
+    )
+    errors, _ = vc.check_references(tmp_path)
+    assert errors == []
+
+
+def test_references_broken_link_reports_path_without_fragment(tmp_path: Path) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "a.md").write_text("See [x](missing.md#part).\n")
+    errors, _ = vc.check_references(tmp_path)
+    assert errors == ['[DOC_REF] a.md: Broken link to "missing.md"']
+
+
+def test_references_check_spaced_and_single_quoted_titles(tmp_path: Path) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "a.md").write_text(
+        "[a](missing file.md) [b](docs/x.md 'T') [c](docs/y.md#s 'T')\n"
+    )
+    errors, _ = vc.check_references(tmp_path)
+    assert errors == [
+        '[DOC_REF] a.md: Broken link to "missing file.md"',
+        '[DOC_REF] a.md: Broken link to "docs/x.md"',
+        '[DOC_REF] a.md: Broken link to "docs/y.md"',
+    ]
+
+
+def test_references_broken_non_utf8_target_is_reported(tmp_path: Path) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "a.md").write_bytes(b"[x](caf\xe9.md) [y](caf\xe9.md)\n")
+    errors, _ = vc.check_references(tmp_path)
+    assert errors == ['[DOC_REF] a.md: Broken link to "caf\ufffd.md"'] * 2
+
+
+def test_references_stat_each_target_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n")
+    for name in ("a.md", "b.md", "c.md"):
+        (tmp_path / "agents" / name).write_text("[g](guide.md) [m](missing.md)\n")
+    probes: list[str] = []
+    original = Path.exists
+
+    def counting_exists(self: Path, *args: Any, **kwargs: Any) -> bool:
+        probes.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", counting_exists)
+    errors, _ = vc.check_references(tmp_path)
+    assert _codes(errors) == ["DOC_REF"] * 3
+    assert probes.count("guide.md") == 2
+    assert probes.count("missing.md") == 2
+
+
+def test_agent_body_is_never_decoded(tmp_path: Path) -> None:
+    root = _build_related_root(tmp_path)
+    (root / "agents" / "agent_one.md").write_bytes(
+        b"---\nname: agent-one\ndescription: a\ntools: Read\nmodel: sonnet\nskills: alpha\n---\n"
+        b"latin-1 body \xe9\xe8 go/go_old\n"
+    )
+    results = vc.run_checks(root, ["agents", "references", "stale"])
+    assert results["errors"] == []
+    assert results["warnings"] == ["[STALE] agent_one.md:8: old-style Go doc reference"]
+
+
+def test_run_checks_reports_in_selection_order(tmp_path: Path) -> None:
+    root = _build_root(tmp_path, [], {"agents/a.md": "no frontmatter\n"})
+    (root / "commands" / "deploy.md").write_text("no frontmatter\n")
+    results = vc.run_checks(root, ["commands", "bogus", "agents"])
+    assert _codes(results["errors"]) == [
+        "CMD_PREFIX",
+        "CMD_FRONTMATTER",
+        "CONFIG",
+        "AGENT_FRONTMATTER",
+    ]
+
+
+# --- check_json_files ---------------------------------------------------------
+
+
+def test_json_schema_errors_are_sorted(tmp_path: Path) -> None:
+    (tmp_path / "schemas").mkdir()
+    for name in ("c.json", "a.json", "b.json"):
+        (tmp_path / "schemas" / name).write_text("{bad")
+    (tmp_path / "schemas" / "ok.json").write_text("{}")
+    (tmp_path / "schemas" / "notes.txt").write_text("{bad")
+    errors, _ = vc.check_json_files(tmp_path)
+    assert [e.split(":")[0] for e in errors] == [
+        "[JSON_INVALID] schemas/a.json",
+        "[JSON_INVALID] schemas/b.json",
+        "[JSON_INVALID] schemas/c.json",
+    ]
+
+
+# --- check_grounding: builder skill reference files ---------------------------
+
+
+def test_grounding_reports_missing_skill_and_reference(tmp_path: Path) -> None:
+    references = tmp_path / "skills" / "agent-builder" / "references"
+    references.mkdir(parents=True)
+    (references / "anthropic-agent-authoring.md").write_text("# ok\n")
+    errors, _ = vc.check_grounding(tmp_path)
+    assert errors == [
+        "[GROUNDING] agent-builder/references/anthropic-prompt-engineering.md: File not found",
+        "[GROUNDING] skills/skill-builder: Directory not found",
+    ]
+
+
+def test_grounding_reports_dangling_reference_symlink(tmp_path: Path) -> None:
+    references = tmp_path / "skills" / "agent-builder" / "references"
+    references.mkdir(parents=True)
+    (references / "anthropic-agent-authoring.md").symlink_to(tmp_path / "deleted.md")
+    (references / "anthropic-prompt-engineering.md").write_text("# ok\n")
+    errors, _ = vc.check_grounding(tmp_path)
+    assert errors[0] == (
+        "[GROUNDING] agent-builder/references/anthropic-agent-authoring.md: File not found"
+    )
+
+
+# --- CLI argument parsing -----------------------------------------------------
+
+
+def _cli_fields(args: vc._CliArgs | None) -> dict[str, Any]:
+    assert args is not None
+    return {name: getattr(args, name) for name in vc._CliArgs.__slots__}
+
+
+def test_fast_args_match_argparse() -> None:
+    argv = ["--root", "/r", "--ai-root=/a", "--check=agents,skills", "--json"]
+    parsed = vc._build_parser().parse_args(argv)
+    assert _cli_fields(vc._parse_args_fast(argv)) == vars(parsed)
+
+
+def test_fast_args_defaults() -> None:
+    assert _cli_fields(vc._parse_args_fast([])) == vars(vc._build_parser().parse_args([]))
+
+
+def test_fast_args_defer_to_argparse() -> None:
+    for argv in (["-h"], ["--roo", "/r"], ["--root"], ["--check", "--json"], ["--json=1"]):
+        assert vc._parse_args_fast(argv) is None, argv
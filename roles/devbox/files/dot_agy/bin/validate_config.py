@@ -26,16 +26,17 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
+import bisect
 import contextlib
-import json
+import functools
+import os
 import re
 import sys
-import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import argparse
     from collections.abc import Callable, Iterator
 
 # ---------------------------------------------------------------------------
@@ -44,6 +45,16 @@ if TYPE_CHECKING:
 
 
 _NEW_KEY_RE = re.compile(r"^[a-zA-Z][-\w]*:")
+# The ``---`` delimited block at the top of a file; group 1 is its body.
+_FRONTMATTER_RE = re.compile(r"\A---[^\S\n]*\n(.*?)^[^\S\n]*---[^\S\n]*$", re.DOTALL | re.MULTILINE)
+# One ``key: value`` line: split on the first colon, both sides trimmed, list
+# items (``- x``) skipped. A value wrapped in matching quotes is captured
+# without them (groups 2-3); any other value lands in group 4.
+_KV_RE = re.compile(
+    r"^(?![^\S\n]*-)[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*"
+    r"(?:([\"'])(.*)\2|(.*?))[^\S\n]*$",
+    re.MULTILINE,
+)
 
 
 def _find_frontmatter_end(lines: list[str]) -> int | None:
@@ -53,20 +64,18 @@ def _find_frontmatter_end(lines: list[str]) -> int | None:
     return None
 
 
+def _kv_pair(match: re.Match[str]) -> tuple[str, str]:
+    return match[1], match[3] if match[2] else match[4]
+
+
 def _parse_kv_line(line: str) -> tuple[str, str] | None:
     """Parse ``key: value`` (or return None if line is not a kv pair).
 
     Strips surrounding quotes; the ``>`` sentinel for multiline is left intact
     for the caller to detect.
     """
-    if ":" not in line or line.lstrip().startswith("-"):
-        return None
-    key, value = line.split(":", 1)
-    key = key.strip()
-    value = value.strip()
-    if len(value) >= 2 and value[0] in ('"', "'") and value[-1] == value[0]:
-        value = value[1:-1]
-    return key, value
+    match = _KV_RE.match(line)
+    return _kv_pair(match) if match else None
 
 
 def parse_frontmatter(content: str) -> dict[str, str] | None:
@@ -80,20 +89,26 @@ def parse_frontmatter(content: str) -> dict[str, str] | None:
 
     Returns None when no valid ``---`` delimited block is found.
     """
-    lines = content.split("\n")
-    if not lines or lines[0].strip() != "---":
+    if not content.startswith("---"):
         return None
-
-    end = _find_frontmatter_end(lines)
-    if end is None:
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
         return None
 
+    pairs = [_kv_pair(kv) for kv in _KV_RE.finditer(match.group(1))]
+    if any(value == ">" for _, value in pairs):
+        return _parse_folded_block(match.group(1).split("\n"))
+    return dict(pairs)
+
+
+def _parse_folded_block(lines: list[str]) -> dict[str, str]:
+    """Line-by-line frontmatter parse, needed only when a ``>`` block is present."""
     result: dict[str, str] = {}
     current_key: str | None = None
     current_value = ""
     multiline = False
 
-    for line in lines[1:end]:
+    for line in lines:
         # Inside a multiline > block — accumulate until next key or blank
         if multiline:
             stripped = line.strip()
@@ -126,17 +141,20 @@ def parse_frontmatter(content: str) -> dict[str, str] | None:
     return result
 
 
-def parse_skills_list(content: str) -> list[str]:
-    """Return skill names from the ``skills:`` frontmatter field."""
-    fm = parse_frontmatter(content)
+def _skills_from_frontmatter(fm: dict[str, str] | None) -> list[str]:
+    """Return skill names from an already-parsed ``skills:`` field."""
     if not fm or "skills" not in fm:
         return []
-    raw = fm["skills"]
     # Strip optional surrounding brackets  skills: [a, b, c]
-    raw = raw.strip("[] ")
+    raw = fm["skills"].strip("[] ")
     return [s.strip() for s in raw.split(",") if s.strip()]
 
 
+def parse_skills_list(content: str) -> list[str]:
+    """Return skill names from the ``skills:`` frontmatter field."""
+    return _skills_from_frontmatter(parse_frontmatter(content))
+
+
 def _parse_inline_list(raw: str) -> list[str]:
     """Parse an inline flow-style YAML list  ``[a, b, c]`` or ``a, b, c``."""
     raw = raw.strip()
@@ -179,8 +197,10 @@ def parse_yaml_list(content: str, field: str) -> list[str]:
 
     Returns [] when the field is absent, empty, or malformed.
     """
+    if not content.startswith("---"):
+        return []
     lines = content.split("\n")
-    if not lines or lines[0].strip() != "---":
+    if lines[0].strip() != "---":
         return []
     end = _find_frontmatter_end(lines)
     if end is None:
@@ -200,12 +220,120 @@ def parse_yaml_list(content: str, field: str) -> list[str]:
     return []
 
 
+# ---------------------------------------------------------------------------
+# Directory listing cache
+# ---------------------------------------------------------------------------
+
+
+# Bytes twin of _FRONTMATTER_RE: locates the block without decoding the body.
+_FRONTMATTER_BYTES_RE = re.compile(
+    rb"\A---[^\S\n]*\n.*?^[^\S\n]*---[^\S\n]*$", re.DOTALL | re.MULTILINE
+)
+
+# (path, raw bytes, parsed frontmatter) for one agents/*.md file. Only the
+# frontmatter block is ever decoded; body scans run bytes regexes over the raw
+# content.
+_AgentDoc = tuple[Path, bytes, dict[str, str] | None]
+
+
+def _load_agent_docs(agent_files: list[Path]) -> list[_AgentDoc]:
+    """Read and parse every agent file once for all agent-scanning checks."""
+    docs: list[_AgentDoc] = []
+    for path in agent_files:
+        raw = path.read_bytes()
+        if b"\r" in raw:
+            # Match read_text()'s universal newlines: CRLF and bare CR become LF.
+            raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        match = _FRONTMATTER_BYTES_RE.match(raw)
+        fm = parse_frontmatter(match.group(0).decode()) if match else None
+        docs.append((path, raw, fm))
+    return docs
+
+
+class _DirCache:
+    """One listing of agents/, skills/ and commands/, shared across checks."""
+
+    __slots__ = ("agent_docs", "agent_files", "available_skills", "command_files", "skill_dirs")
+
+    def __init__(
+        self,
+        *,
+        agent_files: list[Path],
+        skill_dirs: list[Path],
+        command_files: list[Path],
+        available_skills: set[str],
+    ) -> None:
+        self.agent_files = agent_files
+        self.skill_dirs = skill_dirs
+        self.command_files = command_files
+        self.available_skills = available_skills
+        # None until the first agent-scanning check calls load_agent_docs().
+        self.agent_docs: list[_AgentDoc] | None = None
+
+    def load_agent_docs(self) -> list[_AgentDoc]:
+        if self.agent_docs is None:
+            self.agent_docs = _load_agent_docs(self.agent_files)
+        return self.agent_docs
+
+
+def _sorted_entries(directory: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _list_files(directory: Path, suffix: str) -> list[Path]:
+    """Unsorted listing of ``directory/*<suffix>`` (empty when absent)."""
+    try:
+        with os.scandir(directory) as it:
+            return [Path(entry.path) for entry in it if entry.name.endswith(suffix)]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _list_md_files(directory: Path) -> list[Path]:
+    return [Path(entry.path) for entry in _sorted_entries(directory) if entry.name.endswith(".md")]
+
+
+def _scan_skill_dirs(skills_dir: Path) -> tuple[list[Path], set[str]]:
+    """Return (skill directories, names of those holding a SKILL.md).
+
+    ``DirEntry.is_dir()`` answers from the d_type readdir already returned, so
+    only symlinked entries cost a stat; SKILL.md presence is one stat per dir.
+    """
+    skill_dirs: list[Path] = []
+    available: set[str] = set()
+    for entry in _sorted_entries(skills_dir):
+        if not entry.is_dir():
+            continue
+        skill_dirs.append(Path(entry.path))
+        if os.path.exists(os.path.join(entry.path, "SKILL.md")):  # noqa: PTH110, PTH118
+            available.add(entry.name)
+    return skill_dirs, available
+
+
+def _scan_dirs(root: Path) -> _DirCache:
+    skill_dirs, available_skills = _scan_skill_dirs(root / "skills")
+    return _DirCache(
+        agent_files=_list_md_files(root / "agents"),
+        skill_dirs=skill_dirs,
+        command_files=_list_md_files(root / "commands"),
+        available_skills=available_skills,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Individual checks — each returns (errors, warnings)
 # ---------------------------------------------------------------------------
 
 
-def check_agents(root: Path) -> tuple[list[str], list[str]]:
+_REQUIRED_AGENT_FIELDS = ("name", "description", "tools", "model", "skills")
+_VALID_MODELS = frozenset({"sonnet", "opus", "haiku"})
+
+
+def check_agents(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     agents_dir = root / "agents"
     errors: list[str] = []
     warnings: list[str] = []
@@ -214,43 +342,36 @@ def check_agents(root: Path) -> tuple[list[str], list[str]]:
         errors.append("[AGENT_DIR] agents/ directory not found")
         return errors, warnings
 
-    available_skills: set[str] = set()
-    skills_dir = root / "skills"
-    if skills_dir.is_dir():
-        available_skills = {
-            d.name for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()
-        }
+    cache = cache or _scan_dirs(root)
+    available_skills = cache.available_skills
 
-    for agent_file in sorted(agents_dir.glob("*.md")):
+    for agent_file, _, fm in cache.load_agent_docs():
         name = agent_file.name
-        content = agent_file.read_text()
-        fm = parse_frontmatter(content)
-
         if fm is None:
             errors.append(f"[AGENT_FRONTMATTER] {name}: Missing or invalid frontmatter")
             continue
 
         errors.extend(
             f'[AGENT_FIELD] {name}: Missing required field "{field}"'
-            for field in ("name", "description", "tools", "model", "skills")
+            for field in _REQUIRED_AGENT_FIELDS
             if field not in fm
         )
 
-        if "model" in fm and fm["model"] not in ("sonnet", "opus", "haiku"):
+        if "model" in fm and fm["model"] not in _VALID_MODELS:
             errors.append(
                 f'[AGENT_MODEL] {name}: Invalid model "{fm["model"]}" (expected sonnet/opus/haiku)'
             )
 
         errors.extend(
             f'[SKILL_REF] {name}: References non-existent skill "{skill}"'
-            for skill in parse_skills_list(content)
+            for skill in _skills_from_frontmatter(fm)
             if skill not in available_skills
         )
 
     return errors, warnings
 
 
-def check_skills(root: Path) -> tuple[list[str], list[str]]:
+def check_skills(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     skills_dir = root / "skills"
     errors: list[str] = []
     warnings: list[str] = []
@@ -259,14 +380,13 @@ def check_skills(root: Path) -> tuple[list[str], list[str]]:
         errors.append("[SKILL_DIR] skills/ directory not found")
         return errors, warnings
 
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
+    cache = cache or _scan_dirs(root)
+    for skill_dir in cache.skill_dirs:
+        if skill_dir.name not in cache.available_skills:
+            errors.append(f"[SKILL_FILE] {skill_dir.name}: Missing SKILL.md")
             continue
 
         skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
-            errors.append(f"[SKILL_FILE] {skill_dir.name}: Missing SKILL.md")
-            continue
 
         content = skill_file.read_text()
         fm = parse_frontmatter(content)
@@ -291,7 +411,7 @@ def check_skills(root: Path) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-def check_commands(root: Path) -> tuple[list[str], list[str]]:
+def check_commands(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     commands_dir = root / "commands"
     errors: list[str] = []
     warnings: list[str] = []
@@ -300,7 +420,8 @@ def check_commands(root: Path) -> tuple[list[str], list[str]]:
         errors.append("[CMD_DIR] commands/ directory not found")
         return errors, warnings
 
-    for cmd_file in sorted(commands_dir.glob("*.md")):
+    cache = cache or _scan_dirs(root)
+    for cmd_file in cache.command_files:
         if not cmd_file.name.startswith("techne-"):
             errors.append(
                 f"[CMD_PREFIX] {cmd_file.name}: command file must be named "
@@ -321,7 +442,12 @@ def check_commands(root: Path) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-def check_json_files(root: Path) -> tuple[list[str], list[str]]:
+def check_json_files(
+    root: Path,
+    cache: _DirCache | None = None,  # noqa: ARG001 -- uniform check signature
+) -> tuple[list[str], list[str]]:
+    import json  # noqa: PLC0415 -- deferred; importers of the check API skip it
+
     errors: list[str] = []
     warnings: list[str] = []
 
@@ -329,41 +455,56 @@ def check_json_files(root: Path) -> tuple[list[str], list[str]]:
         path = root / name
         if path.exists():
             try:
-                json.loads(path.read_text())
+                with path.open("rb") as f:
+                    json.load(f)
             except json.JSONDecodeError as e:
                 errors.append(f"[JSON_INVALID] {name}: {e}")
 
-    schemas_dir = root / "schemas"
-    if schemas_dir.is_dir():
-        for schema_file in sorted(schemas_dir.glob("*.json")):
-            try:
-                json.loads(schema_file.read_text())
-            except json.JSONDecodeError as e:
-                errors.append(f"[JSON_INVALID] schemas/{schema_file.name}: {e}")
+    # Listing order is irrelevant; sort the (rare) error strings, not the paths.
+    schema_errors: list[str] = []
+    for schema_file in _list_files(root / "schemas", ".json"):
+        try:
+            with schema_file.open("rb") as f:
+                json.load(f)
+        except json.JSONDecodeError as e:
+            schema_errors.append(f"[JSON_INVALID] schemas/{schema_file.name}: {e}")
+    errors.extend(sorted(schema_errors))
 
     return errors, warnings
 
 
-_LINK_RE = re.compile(r"\]\((?!https?://|#|mailto:)([^)]+)\)")
+# Relative markdown link targets only: anything containing "://" (URLs, also
+# inside <...> or a query string), mailto:, in-page anchors and ../ escapes are
+# rejected by the lookahead. Group 1 is everything up to ")" minus any
+# #fragment and trailing "title" / 'title', so odd shapes are still checked.
+_LINK_RE = re.compile(
+    rb"\]\((?!<?(?:#|mailto:|\.\./)|[^)\n]*://)"
+    rb"([^)#\n]+?)(?:#[^)\n]*?)?(?:\s+(?:\"[^\"\n]*\"|'[^'\n]*'))?\s*\)"
+)
 
 
-def check_references(root: Path) -> tuple[list[str], list[str]]:
+def check_references(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
-    agents_dir = root / "agents"
-    if not agents_dir.is_dir():
-        return errors, warnings
-
-    for md_file in sorted(agents_dir.glob("*.md")):
-        content = md_file.read_text()
-        for match in _LINK_RE.finditer(content):
+    cache = cache or _scan_dirs(root)
+    # Agents link to the same handful of docs; stat each distinct target once.
+    # A single upfront walk is not cheaper: the root may be ~/.claude itself,
+    # with projects/ and plugins/ trees far larger than the linked docs.
+    # Maps raw target bytes to its decoded text when broken, or "" when it
+    # resolves, so each distinct target is decoded at most once.
+    broken: dict[bytes, str] = {}
+    for md_file, raw, _ in cache.load_agent_docs():
+        for match in _LINK_RE.finditer(raw):
             target = match.group(1)
-            if target.startswith("../") or "://" in target:
-                continue
-            candidates = [root / target, root / "docs" / target]
-            if not any(c.exists() for c in candidates):
-                errors.append(f'[DOC_REF] {md_file.name}: Broken link to "{target}"')
+            path = broken.get(target)
+            if path is None:
+                path = target.decode(errors="replace")
+                if (root / path).exists() or (root / "docs" / path).exists():
+                    path = ""
+                broken[target] = path
+            if path:
+                errors.append(f'[DOC_REF] {md_file.name}: Broken link to "{path}"')
 
     return errors, warnings
 
@@ -395,32 +536,41 @@ def _is_test_file(path: Path) -> bool:
     )
 
 
+def _walk_managed_dir(directory: Path) -> Iterator[Path]:
+    """Depth-first walk in name order, pruning excluded subtrees unvisited.
+
+    Yields the same paths in the same order as filtering ``sorted(rglob("*"))``,
+    but never lists hidden or references/ trees and sorts names rather than
+    Path objects. Symlinked directories are not descended, as with rglob.
+    """
+    for entry in _sorted_entries(directory):
+        # Skip hidden dirs (.hypothesis/, .venv/, .pytest_cache/, ...) — they
+        # hold tool caches with harvested string literals that trip the
+        # regex-based namespace checks. Bundled references are source
+        # material, not executable command definitions; slash tokens inside
+        # them must not enter the custom command namespace.
+        if entry.name.startswith(".") or entry.name == "references":
+            continue
+        path = Path(entry.path)
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_managed_dir(path)
+        elif entry.is_file() and path.suffix in _CMD_SCAN_SUFFIXES and not _is_test_file(path):
+            yield path
+
+
 def _iter_managed_files(root: Path) -> Iterator[Path]:
     for d in _CMD_SCAN_DIRS:
-        sub = root / d
-        if not sub.is_dir():
-            continue
-        for path in sorted(sub.rglob("*")):
-            relative_path = path.relative_to(sub)
-            # Skip hidden dirs (.hypothesis/, .venv/, .pytest_cache/, ...) — they
-            # hold tool caches with harvested string literals that trip the
-            # regex-based namespace checks.
-            if any(part.startswith(".") for part in relative_path.parts):
-                continue
-            # Bundled references are source material, not executable command
-            # definitions. Slash tokens inside them must not enter the custom
-            # command namespace.
-            if "references" in relative_path.parts:
-                continue
-            if path.is_file() and path.suffix in _CMD_SCAN_SUFFIXES and not _is_test_file(path):
-                yield path
+        yield from _walk_managed_dir(root / d)
     for name in _CMD_SCAN_ROOT_FILES:
         path = root / name
         if path.is_file():
             yield path
 
 
-def check_command_refs(root: Path) -> tuple[list[str], list[str]]:
+def check_command_refs(
+    root: Path,
+    cache: _DirCache | None = None,  # noqa: ARG001 -- uniform check signature
+) -> tuple[list[str], list[str]]:
     """Enforce the techne- command namespace across the managed config.
 
     ERROR  every ``/techne-<x>`` reference must resolve to a command file
@@ -478,21 +628,7 @@ def check_command_refs(root: Path) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-def _collect_skill_names(root: Path) -> set[str]:
-    skills_dir = root / "skills"
-    if not skills_dir.is_dir():
-        return set()
-    return {d.name for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()}
-
-
-def _collect_agent_names(root: Path) -> set[str]:
-    agents_dir = root / "agents"
-    if not agents_dir.is_dir():
-        return set()
-    return {f.stem for f in agents_dir.glob("*.md")}
-
-
-def check_related_links(root: Path) -> tuple[list[str], list[str]]:
+def check_related_links(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     """Every name in a ``related:`` frontmatter list must resolve.
 
     ``related:`` is optional. When present, each name must exist as either
@@ -502,17 +638,13 @@ def check_related_links(root: Path) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
-    skills = _collect_skill_names(root)
-    agents = _collect_agent_names(root)
-    known = skills | agents
+    cache = cache or _scan_dirs(root)
+    known = cache.available_skills | {f.stem for f in cache.agent_files}
 
-    for skill_dir in sorted((root / "skills").iterdir() if (root / "skills").is_dir() else []):
-        if not skill_dir.is_dir():
+    for skill_dir in cache.skill_dirs:
+        if skill_dir.name not in cache.available_skills:
             continue
-        skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
-            continue
-        related = parse_yaml_list(skill_file.read_text(), "related")
+        related = parse_yaml_list((skill_dir / "SKILL.md").read_text(), "related")
         errors.extend(
             f'[RELATED_REF] skills/{skill_dir.name}/SKILL.md: related "{name}" '
             "does not resolve to a skill or agent"
@@ -520,7 +652,7 @@ def check_related_links(root: Path) -> tuple[list[str], list[str]]:
             if name not in known
         )
 
-    for agent_file in sorted((root / "agents").glob("*.md") if (root / "agents").is_dir() else []):
+    for agent_file in cache.agent_files:
         related = parse_yaml_list(agent_file.read_text(), "related")
         errors.extend(
             f'[RELATED_REF] agents/{agent_file.name}: related "{name}" '
@@ -532,7 +664,9 @@ def check_related_links(root: Path) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-def check_trigger_consistency(root: Path) -> tuple[list[str], list[str]]:
+def check_trigger_consistency(
+    root: Path, cache: _DirCache | None = None
+) -> tuple[list[str], list[str]]:
     """Warn when a trigger-loaded skill is not referenced by any agent.
 
     A skill declaring ``triggers:`` (and not ``alwaysApply: true``) relies on
@@ -550,18 +684,16 @@ def check_trigger_consistency(root: Path) -> tuple[list[str], list[str]]:
     if not skills_dir.is_dir() or not agents_dir.is_dir():
         return errors, warnings
 
+    cache = cache or _scan_dirs(root)
     agent_skill_refs: dict[str, int] = {}
-    for agent_file in agents_dir.glob("*.md"):
-        for skill in parse_skills_list(agent_file.read_text()):
+    for _, _, fm in cache.load_agent_docs():
+        for skill in _skills_from_frontmatter(fm):
             agent_skill_refs[skill] = agent_skill_refs.get(skill, 0) + 1
 
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
+    for skill_dir in cache.skill_dirs:
+        if skill_dir.name not in cache.available_skills:
             continue
-        content = skill_file.read_text()
+        content = (skill_dir / "SKILL.md").read_text()
         fm = parse_frontmatter(content) or {}
         if fm.get("alwaysApply", "").lower() in ("true", "1", "yes"):
             continue
@@ -578,33 +710,51 @@ def check_trigger_consistency(root: Path) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-_STALE_PATTERNS = [
-    (re.compile(r"go/go_"), "old-style Go doc reference"),
-    (re.compile(r"python/python_"), "old-style Python doc reference"),
-]
+_STALE_PATTERNS = (
+    ("go/go_", "old-style Go doc reference"),
+    ("python/python_", "old-style Python doc reference"),
+)
+# Scanned one literal at a time: bytes.find is far faster than an alternation regex.
+_STALE_NEEDLES = tuple(pattern.encode() for pattern, _ in _STALE_PATTERNS)
+_FENCE_LINE_RE = re.compile(rb"^[^\S\n]*```.*$", re.MULTILINE)
 
 
-def check_stale_patterns(root: Path) -> tuple[list[str], list[str]]:
-    errors: list[str] = []
-    warnings: list[str] = []
+def _fenced_spans(content: bytes) -> tuple[list[int], list[int]]:
+    """Return sorted (starts, ends) offsets of fenced blocks, fence lines included.
 
-    agents_dir = root / "agents"
-    if not agents_dir.is_dir():
-        return errors, warnings
+    An unterminated fence runs to the end of the content.
+    """
+    fences = list(_FENCE_LINE_RE.finditer(content))
+    starts = [m.start() for m in fences[0::2]]
+    ends = [m.end() for m in fences[1::2]]
+    if len(ends) < len(starts):
+        ends.append(len(content))
+    return starts, ends
 
-    for agent_file in sorted(agents_dir.glob("*.md")):
-        lines = agent_file.read_text().split("\n")
-        in_code_block = False
 
-        for i, line in enumerate(lines, 1):
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
-            for pattern, desc in _STALE_PATTERNS:
-                if pattern.search(line):
-                    warnings.append(f"[STALE] {agent_file.name}:{i}: {desc}")
+def check_stale_patterns(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
+    errors: list[str] = []
+    warnings: list[str] = []
+
+    cache = cache or _scan_dirs(root)
+    for agent_file, raw, _ in cache.load_agent_docs():
+        starts, ends = _fenced_spans(raw)
+        # (line, pattern index) pairs: each pattern is reported at most once per line.
+        found: set[tuple[int, int]] = set()
+        for index, needle in enumerate(_STALE_NEEDLES):
+            line, counted = 1, 0
+            pos = raw.find(needle)
+            while pos != -1:
+                i = bisect.bisect_right(starts, pos) - 1
+                if i < 0 or pos >= ends[i]:
+                    line += raw.count(b"\n", counted, pos)
+                    counted = pos
+                    found.add((line, index))
+                pos = raw.find(needle, pos + len(needle))
+        warnings.extend(
+            f"[STALE] {agent_file.name}:{line}: {_STALE_PATTERNS[index][1]}"
+            for line, index in sorted(found)
+        )
 
     return errors, warnings
 
@@ -614,7 +764,7 @@ SKILL_BUDGET_WARN = 0.80
 SKILL_BUDGET_ERROR = 0.95
 
 
-def check_skill_budget(root: Path) -> tuple[list[str], list[str]]:
+def check_skill_budget(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     """Check total skill description budget utilisation against 16K limit."""
     skills_dir = root / "skills"
     errors: list[str] = []
@@ -623,24 +773,15 @@ def check_skill_budget(root: Path) -> tuple[list[str], list[str]]:
     if not skills_dir.is_dir():
         return errors, warnings
 
-    entries: list[tuple[str, int]] = []
-
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
-            continue
-
-        content = skill_file.read_text()
-        fm = parse_frontmatter(content)
+    # Only the total matters here, so iterate the unordered skill-name set.
+    cache = cache or _scan_dirs(root)
+    total = 0
+    for skill_name in cache.available_skills:
+        fm = parse_frontmatter((skills_dir / skill_name / "SKILL.md").read_text())
         if fm is None or "name" not in fm or "description" not in fm:
             continue
+        total += len(f"- {fm['name']}: {fm['description']}")
 
-        entry = f"- {fm['name']}: {fm['description']}"
-        entries.append((fm["name"], len(entry)))
-
-    total = sum(size for _, size in entries)
     utilisation = total / SKILL_BUDGET_CHARS if SKILL_BUDGET_CHARS > 0 else 0
 
     if utilisation > SKILL_BUDGET_ERROR:
@@ -720,15 +861,18 @@ _GROUNDING_REFS: dict[str, list[str]] = {
 }
 
 
-def check_grounding(root: Path) -> tuple[list[str], list[str]]:
+def check_grounding(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
+    cache = cache or _scan_dirs(root)
+    skill_names = {d.name for d in cache.skill_dirs}
     for skill_name, refs in _GROUNDING_REFS.items():
-        skill_dir = root / "skills" / skill_name
-        if not skill_dir.is_dir():
+        if skill_name not in skill_names:
             errors.append(f"[GROUNDING] skills/{skill_name}: Directory not found")
             continue
+        skill_dir = root / "skills" / skill_name
+        # exists() follows symlinks, so a dangling reference link is reported.
         errors.extend(
             f"[GROUNDING] {skill_name}/{ref}: File not found"
             for ref in refs
@@ -767,11 +911,13 @@ def _strip_non_citations(content: str) -> str:
     kept: list[str] = []
     in_fence = False
     for line in content.split("\n"):
-        if _FENCE_RE.match(line):
+        # Substring tests are far cheaper than the regexes and rule out almost
+        # every prose line: a fence needs ```, a regex span needs a backslash.
+        if "```" in line and _FENCE_RE.match(line):
             in_fence = not in_fence
             continue
         if not in_fence:
-            kept.append(_REGEX_SPAN_RE.sub(" ", line))
+            kept.append(_REGEX_SPAN_RE.sub(" ", line) if "\\" in line else line)
     return "\n".join(kept)
 
 
@@ -853,7 +999,10 @@ def _check_framework_refs(
     return errors, warnings
 
 
-def check_fpf_spec_refs(root: Path) -> tuple[list[str], list[str]]:
+def check_fpf_spec_refs(
+    root: Path,
+    cache: _DirCache | None = None,  # noqa: ARG001 -- uniform check signature
+) -> tuple[list[str], list[str]]:
     """Every FPF and NSTD id cited by its skill must resolve in the references.
 
     Guards the drift class that bin/fpf_drift_check.py cannot see: that script
@@ -880,17 +1029,23 @@ def check_fpf_spec_refs(root: Path) -> tuple[list[str], list[str]]:
     return fpf_errors + nstd_errors, fpf_warnings + nstd_warnings
 
 
-def check_meta_pipeline(root: Path) -> tuple[list[str], list[str]]:
+def check_meta_pipeline(root: Path, cache: _DirCache | None = None) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
     meta_file = root / "agents" / "meta_reviewer.md"
-    if not meta_file.exists():
+    # Reuse the agent checks' parse when they ran; only read the file otherwise.
+    fm = None
+    if cache is not None and cache.agent_docs is not None:
+        fm = next((doc_fm for path, _, doc_fm in cache.agent_docs if path == meta_file), None)
+    if fm is not None:
+        skills = _skills_from_frontmatter(fm)
+    elif meta_file.exists():
+        skills = parse_skills_list(meta_file.read_text())
+    else:
         errors.append("[META_PIPELINE] agents/meta_reviewer.md not found")
         return errors, warnings
 
-    skills = parse_skills_list(meta_file.read_text())
-
     if "agent-builder" not in skills:
         errors.append('[META_PIPELINE] meta_reviewer.md: "agent-builder" missing from skills')
     if "skill-builder" not in skills:
@@ -909,7 +1064,8 @@ def check_meta_pipeline(root: Path) -> tuple[list[str], list[str]]:
 # Registry & runner
 # ---------------------------------------------------------------------------
 
-ALL_CHECKS: dict[str, Callable[..., Any]] = {
+# Every check takes (root, cache=None); run_checks always passes its shared cache.
+ALL_CHECKS: dict[str, Callable[[Path, _DirCache | None], tuple[list[str], list[str]]]] = {
     "agents": check_agents,
     "skills": check_skills,
     "commands": check_commands,
@@ -925,6 +1081,7 @@ ALL_CHECKS: dict[str, Callable[..., Any]] = {
     "fpf-refs": check_fpf_spec_refs,
 }
 
+
 _AI_OWNED_ENTRIES = ("agents", "skills", "commands", "USER_AUTHORITY_PROTOCOL.md")
 
 
@@ -935,6 +1092,8 @@ def validation_root(runtime_root: Path, ai_root: Path | None) -> Iterator[Path]:
         yield runtime_root
         return
 
+    import tempfile  # noqa: PLC0415 -- deferred; only split --ai-root runs need it
+
     with tempfile.TemporaryDirectory(prefix="validate-ai-config-") as temporary_dir:
         merged_root = Path(temporary_dir)
         if runtime_root.is_dir():
@@ -957,28 +1116,20 @@ def run_checks(root: Path, checks: list[str] | None = None) -> dict:
     selected = checks or list(ALL_CHECKS.keys())
     all_errors: list[str] = []
     all_warnings: list[str] = []
-
+    cache = _scan_dirs(root)
     for name in selected:
         fn = ALL_CHECKS.get(name)
         if fn is None:
             all_errors.append(f"[CONFIG] Unknown check: {name}")
             continue
-        errs, warns = fn(root)
+        errs, warns = fn(root, cache)
         all_errors.extend(errs)
         all_warnings.extend(warns)
 
-    agents_dir = root / "agents"
-    skills_dir = root / "skills"
-    commands_dir = root / "commands"
-
     counts = {
-        "agents": len(list(agents_dir.glob("*.md"))) if agents_dir.is_dir() else 0,
-        "skills": (
-            len([d for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()])
-            if skills_dir.is_dir()
-            else 0
-        ),
-        "commands": len(list(commands_dir.glob("*.md"))) if commands_dir.is_dir() else 0,
+        "agents": len(cache.agent_files),
+        "skills": len(cache.available_skills),
+        "commands": len(cache.command_files),
         "errors": len(all_errors),
         "warnings": len(all_warnings),
     }
@@ -1035,7 +1186,32 @@ def format_text(results: dict) -> str:
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
+_DEFAULT_ROOT = Path.home() / ".gemini/antigravity-cli"
+
+
+class _CliArgs:
+    __slots__ = ("ai_root", "budget", "check", "json_output", "root")
+
+    def __init__(
+        self,
+        *,
+        root: Path = _DEFAULT_ROOT,
+        ai_root: Path | None = None,
+        check: str | None = None,
+        json_output: bool = False,
+        budget: bool = False,
+    ) -> None:
+        self.root = root
+        self.ai_root = ai_root
+        self.check = check
+        self.json_output = json_output
+        self.budget = budget
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse  # noqa: PLC0415 -- deferred; the fast path never needs it
+
     parser = argparse.ArgumentParser(
         description="Validate Antigravity CLI agent/skill/command configuration.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1044,7 +1220,7 @@ def main() -> None:
     parser.add_argument(
         "--root",
         type=Path,
-        default=Path.home() / ".gemini/antigravity-cli",
+        default=_DEFAULT_ROOT,
         help="Root directory of Antigravity CLI config (default: ~/.gemini/antigravity-cli)",
     )
     parser.add_argument(
@@ -1070,7 +1246,45 @@ def main() -> None:
         action="store_true",
         help="Show detailed skill description budget report and exit",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args_fast(argv: list[str]) -> _CliArgs | None:
+    """Parse the exact flag spellings main() accepts without building argparse.
+
+    Returns None for anything else (-h, abbreviations, missing values, unknown
+    flags) so argparse can produce its usual help text or error.
+    """
+    args = _CliArgs()
+    i = 0
+    while i < len(argv):
+        flag, sep, value = argv[i].partition("=")
+        if flag in ("--json", "--budget") and not sep:
+            if flag == "--json":
+                args.json_output = True
+            else:
+                args.budget = True
+        elif flag in ("--root", "--ai-root", "--check"):
+            if not sep:
+                i += 1
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+            if flag == "--root":
+                args.root = Path(value)
+            elif flag == "--ai-root":
+                args.ai_root = Path(value)
+            else:
+                args.check = value
+        else:
+            return None
+        i += 1
+    return args
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    args = _parse_args_fast(argv) or _CliArgs(**vars(_build_parser().parse_args(argv)))
 
     with validation_root(args.root, args.ai_root) as merged_root:
         if args.budget:
@@ -1081,6 +1295,8 @@ def main() -> None:
         results = run_checks(merged_root, checks)
 
     if args.json_output:
+        import json  # noqa: PLC0415
+
         print(json.dumps(results, indent=2))
     else:
         print(format_text(results))